@@ -8,48 +8,48 @@ This file provides:
 By default, this module does NOT call any external service.
 """
 
-import copy
+import itertools
 import random
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+# Dedicated generator for the mock, independent of the global random state
+_rng = random.Random()
 
-def mock_dynamic_planner(request: str) -> Dict[str, Any]:
-    """
-    Simulate a non-deterministic planner:
-    - For the same input, it may produce different orders of steps
-    - Or slightly different parameters
+# All 6 orderings of the 3 mock steps; one is picked instead of shuffling
+_PERMS = tuple(itertools.permutations(range(3)))
+_TOP_K_CHOICES = (3, 4, 5)
+_MAX_WORDS_CHOICES = (150, 200, 250)
 
-    This is only for demonstration purposes.
-    """
-    base_steps: List[Dict[str, Any]] = [
+
+def _mock_plan(
+    request: str, perm: Tuple[int, ...], top_k: int = 3, max_words: int = 200
+) -> Dict[str, Any]:
+    # Built fresh on every call (no deepcopy needed), with any drifted
+    # parameters passed in by the caller.
+    base_steps = (
         {
             "id": 1,
             "action": "search",
-            "params": {"source": "web", "query": request, "top_k": 3},
+            "params": {"source": "web", "query": request, "top_k": top_k},
         },
         {
             "id": 2,
             "action": "summarize",
-            "params": {"style": "short", "max_words": 200},
+            "params": {"style": "short", "max_words": max_words},
         },
         {
             "id": 3,
             "action": "reflect",
             "params": {"check_consistency": True},
         },
-    ]
-
-    # Randomly shuffle steps and tweak parameters a bit
-    steps = copy.deepcopy(base_steps)
-    random.shuffle(steps)
+    )
 
-    # Randomly alter a param to show drift
-    if random.random() < 0.5:
-        for step in steps:
-            if step["action"] == "search":
-                step["params"]["top_k"] = random.choice([3, 4, 5])
-            if step["action"] == "summarize":
-                step["params"]["max_words"] = random.choice([150, 200, 250])
+    # Shuffle steps, in the order drawn by the caller
+    steps: List[Dict[str, Any]] = [
+        base_steps[perm[0]],
+        base_steps[perm[1]],
+        base_steps[perm[2]],
+    ]
 
     plan: Dict[str, Any] = {
         "goal": "mock_dynamic_plan",
@@ -63,6 +63,46 @@ def mock_dynamic_planner(request: str) -> Dict[str, Any]:
     return plan
 
 
+def mock_dynamic_plans(request: str, k: int) -> List[Dict[str, Any]]:
+    """
+    Generate k independent mock dynamic plans for the same request.
+
+    All random choices are drawn up front in batches (one `choices` call
+    per parameter) rather than k separate rounds of draws.
+    """
+    perms = _rng.choices(_PERMS, k=k)
+    # Randomly alter a param to show drift (50% of plans)
+    drifts = _rng.choices((False, True), k=k)
+    top_ks = _rng.choices(_TOP_K_CHOICES, k=k)
+    max_words = _rng.choices(_MAX_WORDS_CHOICES, k=k)
+    return [
+        _mock_plan(request, perm, top_k, words) if drift else _mock_plan(request, perm)
+        for perm, drift, top_k, words in zip(perms, drifts, top_ks, max_words)
+    ]
+
+
+def mock_dynamic_planner(request: str) -> Dict[str, Any]:
+    """
+    Simulate a non-deterministic planner:
+    - For the same input, it may produce different orders of steps
+    - Or slightly different parameters
+
+    This is only for demonstration purposes.
+    """
+    # Single-plan path: draw only what this one plan needs
+    perm = _PERMS[_rng.randrange(6)]
+
+    # Randomly alter a param to show drift
+    if _rng.random() < 0.5:
+        return _mock_plan(
+            request,
+            perm,
+            _TOP_K_CHOICES[_rng.randrange(3)],
+            _MAX_WORDS_CHOICES[_rng.randrange(3)],
+        )
+    return _mock_plan(request, perm)
+
+
 # ---------------------------------------------------------------------------
 # Optional: placeholder for real Bedrock Agent integration
 # ---------------------------------------------------------------------------
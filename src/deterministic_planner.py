@@ -10,23 +10,34 @@ into a normalized, JSON-like execution plan.
 """
 
 import argparse
+import codecs
 import json
+import os
+import sys
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+
+# Typed view of the plan schema (see build_plan_typed). The primary builder
+# emits plain dicts with the same shape, so no dataclass -> dict reflection
+# pass is needed to serialize it.
+@dataclass(slots=True)
 class Step:
     id: int
     action: str
     params: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Plan:
     goal: str
     original_request: str
-    steps: List[Step]
+    steps: Tuple[Step, ...]
     constraints: Dict[str, Any]
 
 
@@ -51,167 +62,179 @@ def normalize_goal(request: str) -> str:
     return "generic_information_task"
 
 
-def build_steps(goal: str, request: str) -> List[Step]:
+# Constant params shared by every plan instead of re-allocated per call.
+_EXTRACT_FIELDS = ("title", "year", "abstract")
+_COMPARE_DIMENSIONS = ("pros", "cons", "risks")
+_REPORT_SECTIONS = ("introduction", "body", "conclusion")
+
+
+# One builder per goal: dispatch is a single _STEP_BUILDERS lookup and each
+# builder only splices `request` into a fixed template.
+def _find_papers_and_summarize_steps(request: str) -> Tuple[Dict[str, Any], ...]:
+    return (
+        {
+            "id": 1,
+            "action": "search",
+            "params": {
+                "source": "scholar_like",
+                "query": request,
+                "top_k": 3,
+            },
+        },
+        {
+            "id": 2,
+            "action": "extract",
+            "params": {
+                "fields": _EXTRACT_FIELDS,
+            },
+        },
+        {
+            "id": 3,
+            "action": "summarize",
+            "params": {
+                "style": "concise",
+                "max_words": 300,
+            },
+        },
+    )
+
+
+def _find_papers_steps(request: str) -> Tuple[Dict[str, Any], ...]:
+    return (
+        {
+            "id": 1,
+            "action": "search",
+            "params": {
+                "source": "scholar_like",
+                "query": request,
+                "top_k": 5,
+            },
+        },
+    )
+
+
+def _compare_sources_steps(request: str) -> Tuple[Dict[str, Any], ...]:
+    return (
+        {
+            "id": 1,
+            "action": "identify_entities",
+            "params": {
+                "from_request": True,
+                "max_entities": 4,
+            },
+        },
+        {
+            "id": 2,
+            "action": "fetch_facts",
+            "params": {
+                "per_entity_top_k": 3,
+            },
+        },
+        {
+            "id": 3,
+            "action": "compare",
+            "params": {
+                "dimensions": _COMPARE_DIMENSIONS,
+            },
+        },
+    )
+
+
+def _generate_report_steps(request: str) -> Tuple[Dict[str, Any], ...]:
+    return (
+        {
+            "id": 1,
+            "action": "gather_context",
+            "params": {
+                "source": "mixed",
+                "query": request,
+            },
+        },
+        {
+            "id": 2,
+            "action": "outline",
+            "params": {
+                "sections": _REPORT_SECTIONS,
+            },
+        },
+        {
+            "id": 3,
+            "action": "write",
+            "params": {
+                "format": "markdown",
+                "target_audience": "general",
+            },
+        },
+    )
+
+
+def _fetch_news_steps(request: str) -> Tuple[Dict[str, Any], ...]:
+    return (
+        {
+            "id": 1,
+            "action": "search",
+            "params": {
+                "source": "news_api",
+                "query": request,
+                "top_k": 5,
+            },
+        },
+        {
+            "id": 2,
+            "action": "summarize",
+            "params": {
+                "style": "bullet_points",
+                "max_items": 5,
+            },
+        },
+    )
+
+
+def _generic_steps(request: str) -> Tuple[Dict[str, Any], ...]:
+    # generic fallback pipeline
+    return (
+        {
+            "id": 1,
+            "action": "search",
+            "params": {
+                "source": "web",
+                "query": request,
+                "top_k": 3,
+            },
+        },
+        {
+            "id": 2,
+            "action": "summarize",
+            "params": {
+                "style": "short",
+                "max_words": 200,
+            },
+        },
+    )
+
+
+_STEP_BUILDERS: Dict[str, Callable[[str], Tuple[Dict[str, Any], ...]]] = {
+    "find_papers_and_summarize": _find_papers_and_summarize_steps,
+    "find_papers": _find_papers_steps,
+    "compare_sources": _compare_sources_steps,
+    "generate_report": _generate_report_steps,
+    "fetch_news": _fetch_news_steps,
+}
+
+
+def build_steps(goal: str, request: str) -> Tuple[Dict[str, Any], ...]:
     """
-    Build an ordered list of steps based on the normalized goal.
-    Each branch is deterministic and static.
+    Build an ordered tuple of steps based on the normalized goal.
+    Each builder is deterministic and static.
     """
-    steps: List[Step] = []
-
-    if goal == "find_papers_and_summarize":
-        steps.append(
-            Step(
-                id=1,
-                action="search",
-                params={
-                    "source": "scholar_like",
-                    "query": request,
-                    "top_k": 3,
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=2,
-                action="extract",
-                params={
-                    "fields": ["title", "year", "abstract"],
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=3,
-                action="summarize",
-                params={
-                    "style": "concise",
-                    "max_words": 300,
-                },
-            )
-        )
-    elif goal == "find_papers":
-        steps.append(
-            Step(
-                id=1,
-                action="search",
-                params={
-                    "source": "scholar_like",
-                    "query": request,
-                    "top_k": 5,
-                },
-            )
-        )
-    elif goal == "compare_sources":
-        steps.append(
-            Step(
-                id=1,
-                action="identify_entities",
-                params={
-                    "from_request": True,
-                    "max_entities": 4,
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=2,
-                action="fetch_facts",
-                params={
-                    "per_entity_top_k": 3,
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=3,
-                action="compare",
-                params={
-                    "dimensions": ["pros", "cons", "risks"],
-                },
-            )
-        )
-    elif goal == "generate_report":
-        steps.append(
-            Step(
-                id=1,
-                action="gather_context",
-                params={
-                    "source": "mixed",
-                    "query": request,
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=2,
-                action="outline",
-                params={
-                    "sections": ["introduction", "body", "conclusion"],
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=3,
-                action="write",
-                params={
-                    "format": "markdown",
-                    "target_audience": "general",
-                },
-            )
-        )
-    elif goal == "fetch_news":
-        steps.append(
-            Step(
-                id=1,
-                action="search",
-                params={
-                    "source": "news_api",
-                    "query": request,
-                    "top_k": 5,
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=2,
-                action="summarize",
-                params={
-                    "style": "bullet_points",
-                    "max_items": 5,
-                },
-            )
-        )
-    else:
-        # generic fallback pipeline
-        steps.append(
-            Step(
-                id=1,
-                action="search",
-                params={
-                    "source": "web",
-                    "query": request,
-                    "top_k": 3,
-                },
-            )
-        )
-        steps.append(
-            Step(
-                id=2,
-                action="summarize",
-                params={
-                    "style": "short",
-                    "max_words": 200,
-                },
-            )
-        )
-
-    return steps
-
-
-def build_plan(request: str) -> Plan:
+    return _STEP_BUILDERS.get(goal, _generic_steps)(request)
+
+
+def build_plan_fast(request: str) -> Dict[str, Any]:
     """
     Deterministic end-to-end plan builder.
+    Returns the plain-dict form directly, ready for JSON dumping;
+    no dataclasses are constructed.
     """
     goal = normalize_goal(request)
     steps = build_steps(goal, request)
@@ -219,18 +242,93 @@ def build_plan(request: str) -> Plan:
         "max_latency_ms": 8000,
         "must_be_reproducible": True,
     }
+    return {
+        "goal": goal,
+        "original_request": request,
+        "steps": steps,
+        "constraints": constraints,
+    }
+
+
+# Existing name for the dict-returning builder
+build_plan = build_plan_fast
+
+
+def build_plan_typed(request: str) -> Plan:
+    """
+    Same plan as build_plan_fast, wrapped in Plan/Step dataclasses for
+    callers that want typed attribute access.
+    """
+    data = build_plan_fast(request)
     return Plan(
-        goal=goal,
-        original_request=request,
-        steps=steps,
-        constraints=constraints,
+        goal=data["goal"],
+        original_request=data["original_request"],
+        steps=tuple(
+            Step(id=step["id"], action=step["action"], params=step["params"])
+            for step in data["steps"]
+        ),
+        constraints=data["constraints"],
+    )
+
+
+def plan_to_dict(plan: Union[Plan, Dict[str, Any]]) -> Dict[str, Any]:
+    # build_plan_fast already returns a plain dict; only typed Plans need asdict
+    if isinstance(plan, Plan):
+        return asdict(plan)
+    return plan
+
+
+def _orjson_dumps(
+    data: Any, sort_keys: bool = False, pretty: bool = False
+) -> Optional[bytes]:
+    """
+    UTF-8 JSON bytes from orjson, or None when orjson is not installed or
+    rejects the data (e.g. lone surrogates, which only stdlib json accepts).
+    """
+    if orjson is None:
+        return None
+    option = orjson.OPT_SORT_KEYS if sort_keys else 0
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, option=option)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _stdlib_dumps(data: Any, sort_keys: bool = False, pretty: bool = False) -> str:
+    """
+    Stdlib json configured to produce the same text as orjson
+    (compact separators, no ASCII escaping).
+    """
+    if pretty:
+        return json.dumps(data, sort_keys=sort_keys, ensure_ascii=False, indent=2)
+    return json.dumps(
+        data, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":")
     )
 
 
-def plan_to_dict(plan: Plan) -> Dict[str, Any]:
-    # Convert dataclasses to pure dict structure for JSON dumping
-    data = asdict(plan)
-    return data
+def canonical_json(data: Any) -> str:
+    """
+    Canonical JSON used for plan comparison.
+    - sort_keys=True to ignore key ordering differences
+    """
+    raw = _orjson_dumps(data, sort_keys=True)
+    if raw is not None:
+        return raw.decode()
+    return _stdlib_dumps(data, sort_keys=True)
+
+
+def _stdout_takes_utf8_bytes() -> bool:
+    # Raw UTF-8 bytes only match what print() would write when stdout has a
+    # binary buffer, encodes to UTF-8 and does no newline translation.
+    encoding = getattr(sys.stdout, "encoding", None)
+    return (
+        hasattr(sys.stdout, "buffer")
+        and encoding is not None
+        and codecs.lookup(encoding).name == "utf-8"
+        and os.linesep == "\n"
+    )
 
 
 def main() -> None:
@@ -250,12 +348,20 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    plan = build_plan(args.goal)
-    as_dict = plan_to_dict(plan)
-    if args.pretty:
-        print(json.dumps(as_dict, ensure_ascii=False, indent=2))
+    as_dict = build_plan_fast(args.goal)
+    raw = _orjson_dumps(as_dict, pretty=args.pretty)
+    if raw is not None and _stdout_takes_utf8_bytes():
+        # orjson already yields UTF-8 bytes, so write them as-is
+        sys.stdout.flush()
+        sys.stdout.buffer.write(raw + b"\n")
     else:
-        print(json.dumps(as_dict, ensure_ascii=False))
+        # Text-only or non-UTF-8 streams, and non-UTF-8 argv bytes (which
+        # orjson rejects), go through print() and the stream's own encoding,
+        # error handler and newline translation.
+        if raw is not None:
+            print(raw.decode())
+        else:
+            print(_stdlib_dumps(as_dict, pretty=args.pretty))
 
 
 if __name__ == "__main__":
@@ -8,11 +8,10 @@ Small script to compare:
 This is *not* a benchmark, just a small reproducibility illustration.
 """
 
-import json
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict
 
-from .deterministic_planner import build_plan, plan_to_dict
-from .bedrock_agent_stub import mock_dynamic_planner
+from .deterministic_planner import build_plan_fast, canonical_json
+from .bedrock_agent_stub import mock_dynamic_plans
 
 
 def serialize_plan(plan: Dict[str, Any]) -> str:
@@ -20,29 +19,21 @@ def serialize_plan(plan: Dict[str, Any]) -> str:
     Serialize a plan dict into a canonical JSON string for comparison.
     - sort_keys=True to ignore key ordering differences
     """
-    return json.dumps(plan, sort_keys=True, ensure_ascii=False)
+    return canonical_json(plan)
 
 
-def run_deterministic_trials(request: str, n: int) -> Tuple[int, List[Dict[str, Any]]]:
-    seen: Set[str] = set()
-    plans: List[Dict[str, Any]] = []
-    for _ in range(n):
-        p = plan_to_dict(build_plan(request))
-        s = serialize_plan(p)
-        seen.add(s)
-        plans.append(p)
-    return len(seen), plans
+# Both runners serialize every trial first and then count uniques with one
+# set() call, so deduplication runs in C instead of n set.add() calls.
+def run_deterministic_trials(request: str, n: int) -> int:
+    # Deliberately no memoization or reuse of a single plan: the check is
+    # that n independent builds agree, which a cache would make trivially true.
+    serialized = [serialize_plan(build_plan_fast(request)) for _ in range(n)]
+    return len(set(serialized))
 
 
-def run_dynamic_trials(request: str, n: int) -> Tuple[int, List[Dict[str, Any]]]:
-    seen: Set[str] = set()
-    plans: List[Dict[str, Any]] = []
-    for _ in range(n):
-        p = mock_dynamic_planner(request)
-        s = serialize_plan(p)
-        seen.add(s)
-        plans.append(p)
-    return len(seen), plans
+def run_dynamic_trials(request: str, n: int) -> int:
+    serialized = [serialize_plan(p) for p in mock_dynamic_plans(request, n)]
+    return len(set(serialized))
 
 
 def main() -> None:
@@ -52,8 +43,8 @@ def main() -> None:
     print(f"Testing with request:\n  {request}\n")
     print(f"Number of trials: {trials}\n")
 
-    det_unique, _ = run_deterministic_trials(request, trials)
-    dyn_unique, _ = run_dynamic_trials(request, trials)
+    det_unique = run_deterministic_trials(request, trials)
+    dyn_unique = run_dynamic_trials(request, trials)
 
     print("=== Results ===")
     print(f"Deterministic planner: {det_unique} unique plan(s) over {trials} runs.")